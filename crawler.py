@@ -1,6 +1,8 @@
 import os
 import sys
 import logging
+import functools # For caching formatted dates
+import concurrent.futures # For listing folders in parallel during a scan
 import time # For formatting dates
 import subprocess # For open_in_explorer on Windows
 from PySide6 import QtWidgets, QtGui, QtCore
@@ -11,30 +13,39 @@ APP_VERSION = "1.1" # Example version
 DEVELOPER_NAME = "Sudersen Lekshmikanth"
 SUPPORT_URL = "https://buymeacoffee.com/sudersen"
 FULL_PATH_ROLE = QtCore.Qt.UserRole + 1 # Custom data role
+SORT_ROLE = QtCore.Qt.UserRole + 2 # Display-order key used by the proxy's sort
+LOWER_NAME_ROLE = QtCore.Qt.UserRole + 3 # Lower-cased name matched by the proxy's filter
+SCAN_WORKERS = 4 # Folders listed at once by default; SSDs and network drives take more, HDDs start to thrash
+SCAN_WORKER_CHOICES = (1, 2, 4, 8, 16) # Offered under View > Scan Threads
 
 # --- Helper Functions ---
 # format_size and format_date...
+_SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024**2), ("GB", 1024**3))
+
 def format_size(size_bytes):
     """Converts bytes to human-readable string."""
     if size_bytes is None: return "N/A" # Handle None case
     try:
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024**2:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024**3:
-            return f"{size_bytes / 1024**2:.1f} MB"
-        else:
-            return f"{size_bytes / 1024**3:.1f} GB"
-    except TypeError:
+        # Each unit is 10 more bits, so the bit length picks the unit without a comparison ladder
+        unit_index = min(3, (size_bytes.bit_length() - 1) // 10) if size_bytes else 0
+    except AttributeError:
         return "N/A" # Handle unexpected types
+    if unit_index == 0:
+        return f"{size_bytes} B"
+    unit, factor = _SIZE_UNITS[unit_index]
+    return f"{size_bytes / factor:.1f} {unit}"
+
+@functools.lru_cache(maxsize=8192)
+def _format_minute(minute_ts):
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(minute_ts * 60))
 
 def format_date(timestamp):
     """Formats timestamp into a readable date string."""
     if timestamp is None: return "N/A" # Handle None case
     try:
-        return time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
-    except (ValueError, TypeError, OSError): # Catch more potential errors
+        # The format stops at minutes, so cache per minute: files in a folder tend to share one
+        return _format_minute(int(timestamp // 60))
+    except (ValueError, TypeError, OSError, OverflowError): # Catch more potential errors
         return "Invalid Date"
 
 # --- Filter Proxy Model ---
@@ -49,38 +60,381 @@ class FolderFilterProxyModel(QtCore.QSortFilterProxyModel):
         self.invalidateFilter() # Important: trigger filter update
 
     def filterAcceptsRow(self, source_row, source_parent_index):
-        """Overrides base class method to implement custom filtering."""
+        """
+        Accepts rows whose name contains the filter text. Parents of matching rows are
+        kept by the base class, since recursive filtering is enabled in init_ui.
+        """
         if not self._filter_text: # No filter text, accept everything
             return True
-
         source_model = self.sourceModel()
-        if not source_model: return True # Should not happen if setup correctly
+        name_lower = source_model.data(source_model.index(source_row, 0, source_parent_index), LOWER_NAME_ROLE)
+        return name_lower is not None and self._filter_text in name_lower
+
+
+# --- Directory Listing ---
+def scan_directory(path):
+    """
+    Lists one folder for the tree. Returns (entries, subdirs), where each entry is a
+    (name, path, is_dir, size, mtime, error) tuple and subdirs are the folder paths
+    found, in the order they should be walked. Folders are not stat'ed, so their size
+    and mtime are None. If the folder itself can't be read, entries holds a single
+    placeholder with path None and the label as the name.
+    """
+    entries = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            dir_entries = list(it)
+        # Visit entries in inode order to keep disk seeks short; display order is the proxy's job.
+        # Only POSIX gets the inode from readdir; on Windows inode() costs a stat per entry.
+        if sys.platform != 'win32':
+            try:
+                dir_entries.sort(key=lambda e: e.inode())
+            except OSError:
+                dir_entries.sort(key=lambda e: e.name)
+        for entry in dir_entries:
+            try:
+                # is_dir() comes from the directory read itself; only files need a stat for their size.
+                # Folder dates are read when displayed, or by FolderDateWorker for a Date sort.
+                if entry.is_dir(follow_symlinks=False):
+                    entries.append((entry.name, entry.path, True, None, None, None))
+                    subdirs.append(entry.path)
+                else:
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    entries.append((entry.name, entry.path, False, entry_stat.st_size, entry_stat.st_mtime, None))
+            except OSError as e: # Handle errors for specific entries inside the loop
+                entries.append((entry.name, entry.path, False, None, None, e.strerror))
+                logging.warning("OS Error scanning entry %s: %s", entry.path, e.strerror)
+    except PermissionError:
+        # Indicate inability to scan contents, but keep folder item
+        logging.warning("Permission denied scanning contents of %s", path)
+        entries.append(("[Contents Hidden - Permission Denied]", None, False, None, None, "Permission denied"))
+    except Exception as e:
+        logging.error("Error scanning contents of %s", path, exc_info=True)
+        entries.append(("[Error Scanning Contents]", None, False, None, None, str(e)))
+    return entries, subdirs
+
+
+# --- Tree Node ---
+class Node:
+    """
+    One row of the tree. Size and mtime are kept raw and only formatted when the view
+    asks for them. checked is None for rows without a checkbox (errors, placeholders).
+    """
+    __slots__ = ('path', 'name', 'name_lower', 'parent', 'children', 'is_dir', 'size', 'mtime', 'checked', 'error', 'row')
+
+    def __init__(self, name, path, parent=None, is_dir=False, size=None, mtime=None, error=None):
+        self.name = name
+        self.name_lower = name.lower() # Matched by the filter on every keystroke
+        self.path = path
+        self.parent = parent
+        self.children = []
+        self.is_dir = is_dir
+        self.size = size
+        self.mtime = mtime
+        self.checked = True if path is not None and error is None else None
+        self.error = error
+        self.row = 0
+
+
+_MTIME_UNREADABLE = object() # Stored as a folder's mtime when its stat fails
+
+
+# --- Tree Model ---
+class FolderModel(QtCore.QAbstractItemModel):
+    """
+    Tree model over Node objects. The background scan fills in every folder's children
+    before the view shows the tree, since filtering and copying cover the whole tree.
+    """
+    HEADERS = ("Name", "Size", "Date Modified")
 
-        source_index = source_model.index(source_row, 0, source_parent_index)
-        if not source_index.isValid():
-            return False
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = self._make_root()
+        # Theme lookups hit the icon search path, so resolve each icon once and share it
+        self._open_folder_icon = QtGui.QIcon.fromTheme("folder-open", QtGui.QIcon(":/qt-project.org/styles/commonstyle/images/diropen-16.png"))
+        self._folder_icon = QtGui.QIcon.fromTheme("folder", QtGui.QIcon(":/qt-project.org/styles/commonstyle/images/directory-16.png"))
+        self._file_icon = QtGui.QIcon.fromTheme("text-x-generic", QtGui.QIcon(":/qt-project.org/styles/commonstyle/images/file-16.png"))
+        self._error_brush = QtGui.QBrush(QtCore.Qt.GlobalColor.red)
+
+    @staticmethod
+    def _make_root():
+        return Node("", None, is_dir=True)
+
+    def clear(self):
+        self.beginResetModel()
+        self._root = self._make_root()
+        self.endResetModel()
+
+    def node_from_index(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    def add_root_folder(self, name, path, mtime=None, error=None):
+        """ Adds the top-level row for the scanned folder and returns its node. """
+        node = Node(name, path, self._root, is_dir=error is None, mtime=mtime, error=error)
+        row = len(self._root.children)
+        node.row = row
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._root.children.append(node)
+        self.endInsertRows()
+        return node
+
+    def append_entries(self, parent_node, entries):
+        """
+        Adds scan_directory() entries as children of parent_node.
+        Returns the new folder nodes. Emits no row signals; callers announce the change.
+        """
+        children = parent_node.children
+        folders = []
+        for name, path, is_dir, size, mtime, error in entries:
+            if error is not None and path is not None:
+                name = f"{name} [OS Error]"
+            node = Node(name, path, parent_node, is_dir, size, mtime, error)
+            node.row = len(children)
+            children.append(node)
+            if is_dir:
+                folders.append(node)
+        return folders
+
+    # --- QAbstractItemModel interface ---
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        parent_node = self.node_from_index(parent)
+        if 0 <= row < len(parent_node.children) and 0 <= column < len(self.HEADERS):
+            return self.createIndex(row, column, parent_node.children[row])
+        return QtCore.QModelIndex()
+
+    def parent(self, index=QtCore.QModelIndex()):
+        if not index.isValid(): return QtCore.QModelIndex()
+        parent_node = index.internalPointer().parent
+        if parent_node is None or parent_node is self._root:
+            return QtCore.QModelIndex()
+        return self.createIndex(parent_node.row, 0, parent_node)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0: return 0
+        return len(self.node_from_index(parent).children)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0: return False
+        return bool(self.node_from_index(parent).children)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid(): return QtCore.Qt.NoItemFlags
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        if index.column() == 0 and index.internalPointer().checked is not None:
+            flags |= QtCore.Qt.ItemIsUserCheckable
+        return flags
+
+    def _folder_mtime(self, node):
+        """ Returns a folder's mtime, stat'ing it the first time its date is displayed. """
+        if node.mtime is None:
+            try:
+                node.mtime = os.stat(node.path, follow_symlinks=False).st_mtime
+            except OSError:
+                node.mtime = _MTIME_UNREADABLE
+        return None if node.mtime is _MTIME_UNREADABLE else node.mtime
+
+    def folders_without_mtime(self):
+        """ Returns every folder node whose date hasn't been read yet. """
+        folders = []
+        stack = [self._root]
+        while stack:
+            for child_node in stack.pop().children:
+                if child_node.is_dir:
+                    if child_node.mtime is None:
+                        folders.append(child_node)
+                    stack.append(child_node)
+        return folders
+
+    def set_folder_mtimes(self, results):
+        """ Stores (node, mtime) pairs from FolderDateWorker; mtime None marks a failed stat. """
+        for node, mtime in results:
+            node.mtime = _MTIME_UNREADABLE if mtime is None else mtime
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid(): return None
+        node = index.internalPointer()
+        column = index.column()
+
+        if role == QtCore.Qt.DisplayRole:
+            if column == 0: return node.name
+            if node.path is None: return ""
+            if node.error is not None: return "N/A"
+            if column == 1: return "" if node.is_dir else format_size(node.size)
+            return format_date(self._folder_mtime(node) if node.is_dir else node.mtime)
+
+        if role == SORT_ROLE:
+            if node.path is None: return None
+            if column == 0: return ("0" if node.is_dir else "1") + node.name_lower # Folders first
+            if column == 1: return -1 if node.is_dir else node.size # Folders sort ahead of files by size
+            # Never stat here: sorting asks for every row. Folder dates come from FolderDateWorker.
+            return None if node.mtime is _MTIME_UNREADABLE else node.mtime
+
+        if column == 1 and role == QtCore.Qt.TextAlignmentRole:
+            return QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+        if column != 0: return None
+
+        if role == LOWER_NAME_ROLE:
+            return node.name_lower
+        if role == QtCore.Qt.CheckStateRole:
+            if node.checked is None: return None
+            return QtCore.Qt.CheckState.Checked if node.checked else QtCore.Qt.CheckState.Unchecked
+        if role == FULL_PATH_ROLE:
+            return node.path
+        if role == QtCore.Qt.ToolTipRole:
+            if node.path is None: return node.error
+            if node.error is not None: return f"{node.path}\nError: {node.error}"
+            return node.path
+        if role == QtCore.Qt.DecorationRole:
+            if node.error is not None or node.path is None: return None
+            if node.parent is self._root: return self._open_folder_icon # Use open icon
+            if node.is_dir: return self._folder_icon # Closed folder icon
+            return self._file_icon
+        if role == QtCore.Qt.ForegroundRole and node.error is not None:
+            return self._error_brush
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if role != QtCore.Qt.CheckStateRole or index.column() != 0: return False
+        node = index.internalPointer()
+        if node.checked is None: return False
+        checked = QtCore.Qt.CheckState(value) == QtCore.Qt.CheckState.Checked
+        if checked == node.checked: return True # Nothing to repaint or propagate
+        node.checked = checked
+        self.dataChanged.emit(index, index, [QtCore.Qt.CheckStateRole])
+        if node.children: # Only recurse if it has children
+            self.update_children_checkstate(node, node.checked)
+        return True
+
+    def update_children_checkstate(self, root_node, checked):
+        """
+        Sets check state for all descendants, but only announces root_node's own children.
+        A dataChanged spanning several cells repaints the whole viewport, and rows of
+        collapsed folders read node.checked when they are opened. Announcing every folder
+        would make the proxy map (filter and sort) each one it hasn't shown yet.
+        """
+        stack = [root_node]
+        while stack:
+            for child_node in stack.pop().children:
+                if child_node.checked is not None:
+                    child_node.checked = checked
+                    if child_node.children:
+                        stack.append(child_node)
+        children = root_node.children
+        if children:
+            # Span all columns so even a single child makes the view repaint everything visible
+            first_index = self.createIndex(0, 0, children[0])
+            last_index = self.createIndex(len(children) - 1, len(self.HEADERS) - 1, children[-1])
+            self.dataChanged.emit(first_index, last_index, [QtCore.Qt.CheckStateRole])
+
+
+# --- Background Scan Worker ---
+class ScanWorker(QtCore.QObject):
+    """
+    Walks a folder tree off the GUI thread and reports what it finds in batches.
+    Folders are listed by a small thread pool, so several directory reads can be
+    outstanding at once on slow or remote drives. Each batch is a list of
+    (parent_path, entries) pairs, with entries as returned by scan_directory().
+    A folder's pair always comes after the pair that lists it; empty folders get none.
+    """
+    batch_ready = QtCore.Signal(list)
+    finished = QtCore.Signal(bool) # True if the walk ran to completion
+
+    BATCH_SIZE = 500 # Entries per batch_ready emit
+
+    def __init__(self, root_folder, max_workers=SCAN_WORKERS):
+        super().__init__()
+        self._root_folder = root_folder
+        self._max_workers = max_workers
+        self._cancelled = False
 
-        # Check if the item itself matches
-        item_text = source_model.data(source_index, QtCore.Qt.DisplayRole)
-        if item_text and self._filter_text in item_text.lower():
-            return True
+    def cancel(self):
+        """Asks the walk to stop at the next directory boundary."""
+        self._cancelled = True
 
-        # --- Recursive Check: Keep parent if any child matches ---
-        if source_model.hasChildren(source_index):
-            for i in range(source_model.rowCount(source_index)):
-                if self.filterAcceptsRow(i, source_index):
-                    return True
+    @QtCore.Slot()
+    def run(self):
+        pending = []
+        pending_count = 0
+        stack = [self._root_folder]
+        in_flight = {} # Future -> folder path
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while (stack or in_flight) and not self._cancelled:
+                # Keep only one listing per worker in flight so a cancel doesn't wait on a backlog
+                while stack and len(in_flight) < self._max_workers:
+                    path = stack.pop()
+                    in_flight[executor.submit(scan_directory, path)] = path
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    current_path = in_flight.pop(future)
+                    entries, subdirs = future.result()
+                    stack.extend(reversed(subdirs))
+                    if entries:
+                        pending.append((current_path, entries))
+                        pending_count += len(entries)
+                if pending_count >= self.BATCH_SIZE:
+                    self.batch_ready.emit(pending)
+                    pending = []
+                    pending_count = 0
+
+        if pending and not self._cancelled:
+            self.batch_ready.emit(pending)
+        self.finished.emit(not self._cancelled)
+
+
+# --- Background Folder Date Worker ---
+class FolderDateWorker(QtCore.QObject):
+    """
+    Stats folders off the GUI thread so the tree can be sorted by date. The scan
+    doesn't stat folders, so this only runs when the Date column is sorted.
+    finished carries a list of (node, mtime) pairs, with mtime None where the
+    stat failed.
+    """
+    finished = QtCore.Signal(list)
+
+    def __init__(self, folder_nodes):
+        super().__init__()
+        self._folder_nodes = folder_nodes
+        self._cancelled = False
+
+    def cancel(self):
+        """Asks the worker to stop before the next folder."""
+        self._cancelled = True
 
-        return False
+    @QtCore.Slot()
+    def run(self):
+        results = []
+        for node in self._folder_nodes:
+            if self._cancelled: break
+            try:
+                mtime = os.stat(node.path, follow_symlinks=False).st_mtime
+            except OSError:
+                mtime = None
+            results.append((node, mtime))
+        self.finished.emit(results)
 
 
 # --- Main Window (Now QMainWindow) ---
 class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
     def __init__(self):
         super().__init__()
-        self._block_item_changed_signal = False
         self._context_menu_index = QtCore.QModelIndex()
         self._current_scan_path = None # Keep track of the scanned path
+        self._scan_thread = None
+        self._scan_worker = None
+        self._scan_nodes = {} # Folder path -> node, so batches only need paths
+        self._scan_count = 0
+        self._scan_workers = SCAN_WORKERS # Set from View > Scan Threads, used by the next scan
+        self._date_thread = None
+        self._date_worker = None
         self.init_ui()
 
     def init_ui(self):
@@ -94,9 +448,6 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
         self.setCentralWidget(central_widget)
         main_layout = QtWidgets.QVBoxLayout(central_widget)
 
-        # --- Menu Bar ---
-        self.create_menu_bar()
-
         # --- Layouts ---
         top_layout = QtWidgets.QHBoxLayout()
         search_layout = QtWidgets.QHBoxLayout()
@@ -144,6 +495,9 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
         self.tree_view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.tree_view.setDragDropMode(QtWidgets.QAbstractItemView.NoDragDrop)
         self.tree_view.setUniformRowHeights(True) # Performance hint
+        self.tree_view.setAnimated(False) # Animated expand/collapse relayouts every visible row per frame
+        self.tree_view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerItem) # With uniform rows, row offsets are simple arithmetic
+        self.tree_view.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
         self.tree_view.setAlternatingRowColors(True) # Use QSS for styling this
 
         # --- Add Widgets to Stacked Widget ---
@@ -163,22 +517,27 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
 
 
         # --- Model Setup ---
-        self.model = QtGui.QStandardItemModel()
-        self.model.setColumnCount(3)
-        self.model.setHeaderData(0, QtCore.Qt.Horizontal, "Name")
-        self.model.setHeaderData(1, QtCore.Qt.Horizontal, "Size")
-        self.model.setHeaderData(2, QtCore.Qt.Horizontal, "Date Modified")
+        self.model = FolderModel(self)
 
         self.proxy_model = FolderFilterProxyModel(self)
         self.proxy_model.setSourceModel(self.model)
         self.proxy_model.setFilterKeyColumn(0)
         self.proxy_model.setRecursiveFilteringEnabled(True)
+        self.proxy_model.setSortRole(SORT_ROLE)
+
+        # Refilter once typing pauses instead of re-walking the tree on every keystroke
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self.proxy_model.set_filter_text(self.search_edit.text()))
 
         self.tree_view.setModel(self.proxy_model)
+        self.tree_view.sortByColumn(0, QtCore.Qt.AscendingOrder) # Folders first, then by name
 
         self.tree_view.header().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
         self.tree_view.setColumnWidth(1, 100)
         self.tree_view.setColumnWidth(2, 150)
+        self._header_state = self.tree_view.header().saveState() # Restored when the view is reattached after a scan
 
         # --- Assemble Layouts ---
         top_layout.addWidget(self.select_button)
@@ -201,9 +560,13 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
         # --- Connect Signals ---
         self.select_button.clicked.connect(self.select_folder)
         self.copy_button.clicked.connect(self.copy_tree_to_clipboard)
-        self.model.itemChanged.connect(self.handle_item_changed)
-        self.search_edit.textChanged.connect(self.proxy_model.set_filter_text)
+        self.search_edit.textChanged.connect(self._filter_timer.start) # Restarting the timer drops the pending filter
         self.tree_view.customContextMenuRequested.connect(self.show_context_menu)
+        self.tree_view.header().sortIndicatorChanged.connect(self._sort_indicator_changed)
+
+        # --- Menu Bar ---
+        # Built last: the View menu connects straight to the tree view
+        self.create_menu_bar()
 
         self.apply_styles()
 
@@ -217,6 +580,29 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
         # exit_action.triggered.connect(self.close)
         # file_menu.addAction(exit_action)
 
+        # --- View Menu ---
+        view_menu = menu_bar.addMenu("&View")
+
+        # expandRecursively/collapseAll run in C++ with one relayout, unlike expanding row by row
+        expand_all_action = QtGui.QAction("&Expand All", self)
+        expand_all_action.triggered.connect(lambda: self.tree_view.expandRecursively(self.proxy_model.index(0, 0), -1))
+        view_menu.addAction(expand_all_action)
+
+        collapse_all_action = QtGui.QAction("&Collapse All", self)
+        collapse_all_action.triggered.connect(self.tree_view.collapseAll)
+        view_menu.addAction(collapse_all_action)
+
+        view_menu.addSeparator()
+        scan_threads_menu = view_menu.addMenu("Scan &Threads")
+        scan_threads_group = QtGui.QActionGroup(self) # Exclusive by default
+        for worker_count in SCAN_WORKER_CHOICES:
+            scan_threads_action = QtGui.QAction(str(worker_count), self)
+            scan_threads_action.setCheckable(True)
+            scan_threads_action.setChecked(worker_count == self._scan_workers)
+            scan_threads_action.triggered.connect(lambda checked=False, n=worker_count: self.set_scan_workers(n))
+            scan_threads_group.addAction(scan_threads_action)
+            scan_threads_menu.addAction(scan_threads_action)
+
         # --- Help Menu ---
         help_menu = menu_bar.addMenu("&Help")
 
@@ -229,6 +615,11 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
         help_menu.addAction(support_action)
 
 
+    def set_scan_workers(self, worker_count):
+        """Sets how many folders the next scan lists at once."""
+        self._scan_workers = worker_count
+        self.update_status(f"Scan threads set to {worker_count}. Applies to the next scan.")
+
     def show_about_dialog(self):
         """Displays the About dialog box."""
         about_text = (
@@ -328,192 +719,169 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
             self.update_status(f"Scanning folder: {os.path.basename(folder)}...")
             self.search_edit.clear()
             QtCore.QCoreApplication.processEvents()
-            # Switch to tree view *before* populating (optional, shows empty tree during scan)
-            # self.stacked_widget.setCurrentWidget(self.tree_view)
-            success = self.populate_tree(folder)
-            # Switch view *after* attempting to populate
-            if success:
-                self.stacked_widget.setCurrentWidget(self.tree_view)
-            else:
-                 # If initial scan fails, stay on intro/show error
-                 self.stacked_widget.setCurrentWidget(self.intro_widget)
+            # The tree view is shown by _scan_finished once the background scan is done,
+            # or straight away with the error row if the folder itself can't be read
+            self.populate_tree(folder)
 
 
     def populate_tree(self, root_folder):
+        """
+        Adds the root folder item and starts a background scan of its contents.
+        Returns True if the scan was started; if the folder can't be read, the tree
+        is shown with just its error row and False is returned.
+        """
         # Reset view state before populating
+        self.stop_scan()
+        self.stop_folder_dates()
         self.copy_button.setEnabled(False)
-        # Switch to intro view while clearing/scanning if preferred
-        # self.stacked_widget.setCurrentWidget(self.intro_widget)
-        # QtCore.QCoreApplication.processEvents()
 
-        try:
-            self.model.itemChanged.disconnect(self.handle_item_changed)
-        except RuntimeError: pass
+        # Freeze the (hidden) view while rows stream in; _scan_finished unfreezes it and sorts once.
+        # The model stays set: every setModel() leaks the old selection models of the view and header.
+        self._header_state = self.tree_view.header().saveState()
+        self.stacked_widget.setCurrentWidget(self.intro_widget)
+        self.tree_view.setUpdatesEnabled(False)
+        self.tree_view.setSortingEnabled(False)
+        self.proxy_model.setDynamicSortFilter(False)
         self.model.clear()
-        self.model.setHorizontalHeaderLabels(["Name", "Size", "Date Modified"])
-        invisible_root = self.model.invisibleRootItem()
 
-        scan_successful = False # Flag to track success
-        try:
-            # --- Start recursive population ---
-            # Add the root folder itself as the first top-level item
-            self.add_folder_item_recursive(root_folder, invisible_root)
-
-            self.update_status("Scan complete. Check/uncheck items. Right-click for options.")
-            self.copy_button.setEnabled(True)
-            scan_successful = True
-        except Exception as e:
-            self.update_status(f"Error during scan: {e}")
-            QtWidgets.QMessageBox.critical(self, "Scan Error", f"An error occurred during the initial scan:\n{e}")
-            logging.error("Scan Error", exc_info=True)
-            self.copy_button.setEnabled(False)
-            scan_successful = False
-        finally:
-            self.model.itemChanged.connect(self.handle_item_changed)
-            # Expand the first item only if scan was successful
-            if scan_successful:
-                root_proxy_index = self.proxy_model.index(0, 0)
-                if root_proxy_index.isValid():
-                    self.tree_view.expand(root_proxy_index)
-        return scan_successful # Return success status
-
-
-    def add_folder_item_recursive(self, current_path, parent_item):
-        """
-        Adds the item for current_path and then recursively scans its contents.
-        Now handles the top-level item correctly.
-        """
-        base_name = os.path.basename(current_path) if current_path else "Unknown"
-        item_name = QtGui.QStandardItem(base_name) # Column 0: Name
-        item_size = QtGui.QStandardItem("")         # Column 1: Size
-        item_date = QtGui.QStandardItem("")         # Column 2: Date
-        item_name.setEditable(False)
-        item_size.setEditable(False)
-        item_date.setEditable(False)
-        item_size.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        # Add the root folder itself as the first top-level row
+        root_node = self.add_root_folder_item(root_folder)
+        if root_node is None:
+            self._attach_tree_view()
+            self.stacked_widget.setCurrentWidget(self.tree_view)
+            return False
 
+        self._scan_nodes = {root_folder: root_node}
+        self._scan_count = 0
+
+        # --- Start background scan ---
+        self._scan_thread = QtCore.QThread(self)
+        self._scan_worker = ScanWorker(root_folder, self._scan_workers)
+        self._scan_worker.moveToThread(self._scan_thread)
+        self._scan_thread.started.connect(self._scan_worker.run)
+        self._scan_worker.batch_ready.connect(self._append_batch)
+        self._scan_worker.finished.connect(self._scan_finished)
+        self._scan_worker.finished.connect(self._scan_thread.quit)
+        self._scan_thread.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.finished.connect(self._scan_thread.deleteLater)
+        self._scan_thread.start()
+        return True
+
+    def stop_scan(self):
+        """Cancels a running background scan and waits for its thread to exit."""
+        if self._scan_thread is None: return
+        self._scan_worker.cancel()
+        self._scan_thread.quit()
+        self._scan_thread.wait()
+        self._scan_thread = None
+        self._scan_worker = None
+        self._scan_nodes = {}
+
+    def add_root_folder_item(self, root_folder):
+        """ Adds the row for the scanned folder itself. Returns its node, or None if it can't be read. """
+        base_name = os.path.basename(root_folder) if root_folder else "Unknown"
         try:
-            stat_info = os.stat(current_path)
-            item_name.setData(current_path, FULL_PATH_ROLE)
-            item_name.setToolTip(current_path)
-            item_name.setCheckable(True)
-            item_name.setCheckState(QtCore.Qt.CheckState.Checked)
-            item_name.setIcon(QtGui.QIcon.fromTheme("folder-open", QtGui.QIcon(":/qt-project.org/styles/commonstyle/images/diropen-16.png"))) # Use open icon
-            item_date.setText(format_date(stat_info.st_mtime))
-            # Append row early so children can be added
-            parent_item.appendRow([item_name, item_size, item_date])
+            stat_info = os.stat(root_folder)
+            return self.model.add_root_folder(base_name, root_folder, mtime=stat_info.st_mtime)
 
         except Exception as e: # Handle stat error for the folder itself
-            item_name.setText(f"{base_name} [Access Error]")
-            item_name.setToolTip(f"{current_path}\nError: {e}")
-            item_name.setCheckable(False)
-            item_name.setForeground(QtGui.QBrush(QtCore.Qt.GlobalColor.red))
-            item_size.setText("N/A")
-            item_date.setText("N/A")
-            parent_item.appendRow([item_name, item_size, item_date])
-            logging.error("Error stating path %s", current_path, exc_info=True)
-            return # Stop recursion for this path if we can't stat it
-
-        # --- Scan Contents (only if stat succeeded) ---
+            self.model.add_root_folder(f"{base_name} [Access Error]", root_folder, error=str(e))
+            logging.error("Error stating path %s", root_folder, exc_info=True)
+            self.update_status(f"Error during scan: {e}")
+            return None
+
+    @QtCore.Slot(list)
+    def _append_batch(self, batch):
+        """ Adds a batch of scanned entries under their (already created) parent nodes. """
+        if self._scan_worker is None or self.sender() is not self._scan_worker: return # Stale batch from a cancelled scan
+        # append_entries() emits no row signals, so the whole batch is announced with a
+        # single layout change instead of one rowsInserted (and proxy/view update) per row
+        self.model.layoutAboutToBeChanged.emit()
         try:
-            entries = sorted(os.scandir(current_path), key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
-            for entry in entries:
-                try:
-                    entry_stat = entry.stat(follow_symlinks=False)
-                    # Create items for the entry row
-                    entry_name_item = QtGui.QStandardItem(entry.name)
-                    entry_name_item.setData(entry.path, FULL_PATH_ROLE)
-                    entry_name_item.setToolTip(entry.path)
-                    entry_name_item.setEditable(False)
-                    entry_name_item.setCheckable(True)
-                    entry_name_item.setCheckState(QtCore.Qt.CheckState.Checked)
-
-                    entry_size_item = QtGui.QStandardItem()
-                    entry_size_item.setEditable(False)
-                    entry_size_item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-
-                    entry_date_item = QtGui.QStandardItem(format_date(entry_stat.st_mtime))
-                    entry_date_item.setEditable(False)
-
-                    if entry.is_dir(follow_symlinks=False):
-                        entry_name_item.setIcon(QtGui.QIcon.fromTheme("folder", QtGui.QIcon(":/qt-project.org/styles/commonstyle/images/directory-16.png"))) # Closed folder icon
-                        item_name.appendRow([entry_name_item, entry_size_item, entry_date_item])
-                        self.add_folder_item_recursive(entry.path, entry_name_item) # Recurse
-                    else:
-                        entry_name_item.setIcon(QtGui.QIcon.fromTheme("text-x-generic", QtGui.QIcon(":/qt-project.org/styles/commonstyle/images/file-16.png")))
-                        entry_size_item.setText(format_size(entry_stat.st_size))
-                        item_name.appendRow([entry_name_item, entry_size_item, entry_date_item])
-
-                except OSError as e: # Handle errors for specific entries inside the loop
-                    error_item = QtGui.QStandardItem(f"{entry.name} [OS Error]")
-                    # ... (error handling as before) ...
-                    error_size = QtGui.QStandardItem("N/A")
-                    error_date = QtGui.QStandardItem("N/A")
-                    item_name.appendRow([error_item, error_size, error_date])
-                    logging.warning("OS Error scanning entry %s: %s", entry.path, e.strerror)
-
-        except PermissionError:
-            # Indicate inability to scan contents, but keep folder item
-             logging.warning("Permission denied scanning contents of %s", current_path)
-             # Add a placeholder child item indicating failure?
-             perm_denied_item = QtGui.QStandardItem("[Contents Hidden - Permission Denied]")
-             perm_denied_item.setEditable(False)
-             perm_denied_item.setCheckable(False)
-             perm_denied_item.setForeground(QtGui.QBrush(QtCore.Qt.GlobalColor.red))
-             item_name.appendRow([perm_denied_item, QtGui.QStandardItem(""), QtGui.QStandardItem("")])
-
-        except Exception as e:
-            logging.error("Error scanning contents of %s", current_path, exc_info=True)
-            # Indicate generic scan error
-            scan_error_item = QtGui.QStandardItem("[Error Scanning Contents]")
-            # ... (style as error) ...
-            item_name.appendRow([scan_error_item, QtGui.QStandardItem(""), QtGui.QStandardItem("")])
-
-    # --- handle_item_changed  ---
-    @QtCore.Slot(QtGui.QStandardItem)
-    def handle_item_changed(self, item):
-        """ Handles check state changes, including recursion """
-        if self._block_item_changed_signal: return
-        if item.column() == 0 and item.isCheckable():
-            check_state = item.checkState()
-            self._block_item_changed_signal = True
-            try:
-                # Find the actual item in column 0 if needed (handles multi-column changes better)
-                name_item_index = self.model.index(item.row(), 0, item.parent().index() if item.parent() else QtCore.QModelIndex())
-                name_item = self.model.itemFromIndex(name_item_index)
-                if name_item and name_item.hasChildren(): # Only recurse if it has children
-                    self.update_children_checkstate(name_item, check_state)
-            finally:
-                self._block_item_changed_signal = False
-
-    # --- update_children_checkstate ---
-    def update_children_checkstate(self, parent_name_item, state):
-        """ Recursively sets check state for children (accessing item at column 0) """
-        for row in range(parent_name_item.rowCount()):
-            child_name_item = parent_name_item.child(row, 0) # Checkbox is in column 0
-            if child_name_item and child_name_item.isCheckable():
-                if child_name_item.checkState() != state:
-                    child_name_item.setCheckState(state)
-                if child_name_item.hasChildren():
-                     self.update_children_checkstate(child_name_item, state)
+            for parent_path, entries in batch:
+                parent_node = self._scan_nodes.get(parent_path)
+                if parent_node is None: continue
+                for folder_node in self.model.append_entries(parent_node, entries):
+                    self._scan_nodes[folder_node.path] = folder_node
+                self._scan_count += len(entries)
+        finally:
+            self.model.layoutChanged.emit()
+        self.statusBar().showMessage(f"Scanning... {self._scan_count} items found")
+
+    @QtCore.Slot(bool)
+    def _scan_finished(self, completed):
+        if self._scan_worker is None or self.sender() is not self._scan_worker: return
+        self._scan_thread = None
+        self._scan_worker = None
+        self._scan_nodes = {}
+
+        self._attach_tree_view()
+        self.tree_view.expandToDepth(0) # Show the root folder's contents
+        self.stacked_widget.setCurrentWidget(self.tree_view)
+        if completed:
+            self.update_status("Scan complete. Check/uncheck items. Right-click for options.")
+            self.copy_button.setEnabled(True)
+        if self.tree_view.header().sortIndicatorSection() == 2: # Restored Date sort
+            self.load_folder_dates()
+
+    @QtCore.Slot(int, QtCore.Qt.SortOrder)
+    def _sort_indicator_changed(self, section, order):
+        if section == 2:
+            self.load_folder_dates()
+
+    def load_folder_dates(self):
+        """ Reads the dates of folders not stat'ed yet on a background thread, then re-sorts. """
+        if self._date_thread is not None or self._scan_worker is not None: return # Running, or the scan will call back
+        folder_nodes = self.model.folders_without_mtime()
+        if not folder_nodes: return
+        self.update_status(f"Reading dates of {len(folder_nodes)} folders...")
+        self._date_thread = QtCore.QThread(self)
+        self._date_worker = FolderDateWorker(folder_nodes)
+        self._date_worker.moveToThread(self._date_thread)
+        self._date_thread.started.connect(self._date_worker.run)
+        self._date_worker.finished.connect(self._folder_dates_loaded)
+        self._date_worker.finished.connect(self._date_thread.quit)
+        self._date_thread.finished.connect(self._date_worker.deleteLater)
+        self._date_thread.finished.connect(self._date_thread.deleteLater)
+        self._date_thread.start()
+
+    def stop_folder_dates(self):
+        """Cancels a running folder date read and waits for its thread to exit."""
+        if self._date_thread is None: return
+        self._date_worker.cancel()
+        self._date_thread.quit()
+        self._date_thread.wait()
+        self._date_thread = None
+        self._date_worker = None
+
+    @QtCore.Slot(list)
+    def _folder_dates_loaded(self, results):
+        if self._date_worker is None or self.sender() is not self._date_worker: return
+        self._date_thread = None
+        self._date_worker = None
+        self.model.set_folder_mtimes(results)
+        if self.tree_view.header().sortIndicatorSection() == 2:
+            self.proxy_model.invalidate() # Re-sort now that every folder has a date
+        self.update_status("Folder dates loaded.")
+
+    def _attach_tree_view(self):
+        """ Undoes the freezing done by populate_tree: re-enables sorting and updates. """
+        self.tree_view.header().restoreState(self._header_state) # The model reset drops widths and sort indicator
+        self.proxy_model.setDynamicSortFilter(True)
+        self.tree_view.setSortingEnabled(True)
+        self.tree_view.setUpdatesEnabled(True)
 
+    def closeEvent(self, event):
+        self.stop_scan()
+        self.stop_folder_dates()
+        super().closeEvent(event)
 
     # --- copy_tree_to_clipboard  ---
     @QtCore.Slot()
     def copy_tree_to_clipboard(self):
         self.update_status("Generating text for clipboard...")
         QtCore.QCoreApplication.processEvents()
-        text_lines = []
-        # Use proxy model's root for iteration
-        invisible_root_proxy = self.proxy_model.index(0,0).parent() # Get proxy root
-        for row in range(self.proxy_model.rowCount(invisible_root_proxy)):
-            proxy_index = self.proxy_model.index(row, 0, invisible_root_proxy)
-            if not proxy_index.isValid(): continue
-            # Start recursive generation using the PROXY index
-            # Pass True for is_last_sibling based on loop index
-            self.generate_text_recursive_v2(proxy_index, "", row == (self.proxy_model.rowCount(invisible_root_proxy) - 1), text_lines)
-
-        final_text = "\n".join(text_lines)
+        final_text = "\n".join(self._iter_lines())
         if final_text:
             clipboard = QtGui.QGuiApplication.clipboard()
             clipboard.setText(final_text)
@@ -521,24 +889,27 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
         else:
             self.update_status("Nothing to copy (no visible/checked items or tree empty).")
 
-    # --- generate_text_recursive_v2  ---
-    def generate_text_recursive_v2(self, proxy_index, prefix, is_last_sibling, output_lines):
-        source_index = self.proxy_model.mapToSource(proxy_index)
-        if not source_index.isValid(): return
-        item = self.model.itemFromIndex(source_index) # Get item from SOURCE model
-        if not item: return
-
-        if item.isCheckable() and item.checkState() == QtCore.Qt.CheckState.Checked:
-            item_text = item.text()
-            connector = "└─ " if is_last_sibling else "├─ "
-            output_lines.append(f"{prefix}{connector}{item_text}")
+    # --- _iter_lines  ---
+    def _iter_lines(self):
+        """
+        Yields one line per checked row in display order. Walks the proxy with an
+        explicit stack, so sorting and filtering match the view; each row's check
+        state is read straight off its source node.
+        """
+        proxy_model = self.proxy_model
+        num_roots = proxy_model.rowCount()
+        stack = [(proxy_model.index(row, 0), "", row == num_roots - 1) for row in reversed(range(num_roots))]
+        while stack:
+            proxy_index, prefix, is_last_sibling = stack.pop()
+            node = self.model.node_from_index(proxy_model.mapToSource(proxy_index))
+            if not node.checked: continue # Unchecked rows leave out their whole subtree
+
+            yield prefix + ("└─ " if is_last_sibling else "├─ ") + node.name
             prefix_for_children = prefix + ("   " if is_last_sibling else "│  ")
-            num_children = self.proxy_model.rowCount(proxy_index) # Count children in PROXY
-            for row in range(num_children):
-                child_proxy_index = self.proxy_model.index(row, 0, proxy_index)
-                if child_proxy_index.isValid():
-                    is_last_child = (row == num_children - 1)
-                    self.generate_text_recursive_v2(child_proxy_index, prefix_for_children, is_last_child, output_lines)
+            num_children = proxy_model.rowCount(proxy_index) # Count children in PROXY
+            # Push in reverse so the first child is popped (and written) first
+            for row in reversed(range(num_children)):
+                stack.append((proxy_model.index(row, 0, proxy_index), prefix_for_children, row == num_children - 1))
 
 
     # --- Context Menu  ---
@@ -548,9 +919,7 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
         if not proxy_index.isValid(): return
         source_index = self.proxy_model.mapToSource(proxy_index)
         if not source_index.isValid(): return
-        item = self.model.itemFromIndex(source_index)
-        if not item: return
-        path = item.data(FULL_PATH_ROLE)
+        path = self.model.node_from_index(source_index).path
         if not path: return
 
         menu = QtWidgets.QMenu(self)
@@ -568,16 +937,24 @@ class FolderTreeView(QtWidgets.QMainWindow): # Inherit from QMainWindow
         menu.exec(self.tree_view.viewport().mapToGlobal(point))
 
     # --- open_in_explorer, open_item, copy_path  ---
+    @staticmethod
+    def _launch_detached(args):
+        """ Starts a file manager without waiting for it; only a failure to launch raises. """
+        if sys.platform == 'win32':
+            subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=subprocess.CREATE_NO_WINDOW)
+        else:
+            subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
     def open_in_explorer(self, path):
         try:
             norm_path = os.path.normpath(path) # Normalize path
             if sys.platform == 'win32':
                  if os.path.isdir(norm_path): os.startfile(norm_path)
-                 else: subprocess.run(['explorer', '/select,', norm_path], check=True) # Added check=True
+                 else: self._launch_detached(['explorer', '/select,', norm_path])
             elif sys.platform == 'darwin':
-                 subprocess.run(['open', '-R' if os.path.isfile(norm_path) else norm_path], check=True)
+                 self._launch_detached(['open', '-R', norm_path] if os.path.isfile(norm_path) else ['open', norm_path])
             else: # Linux
-                 subprocess.run(['xdg-open', os.path.dirname(norm_path) if os.path.isfile(norm_path) else norm_path], check=True)
+                 self._launch_detached(['xdg-open', os.path.dirname(norm_path) if os.path.isfile(norm_path) else norm_path])
             self.update_status(f"Opened/Selected: {os.path.basename(norm_path)}")
         except Exception as e:
             logging.error("Failed to open in explorer: %s", path, exc_info=True)